@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""Find popular HuggingFace models that are missing from the MOT catalog.
+
+Compares the model YAML files under models/ against the most downloaded
+models on the HuggingFace hub and reports the ones MOT does not track yet,
+grouped by priority and model type.
+
+Usage: python scripts/find_missing_models.py [--models-dir models] [--limit 1000]
+"""
+
+import argparse
+import asyncio
+import bisect
+import functools
+import io
+import math
+import operator
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+import orjson
+import yaml
+import zstandard as zstd
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+_dl_key = operator.attrgetter('downloads')
+
+_EQ80 = '=' * 80 + '\n'
+_DASH80 = '-' * 80 + '\n'
+
+
+@dataclass(slots=True)
+class HFModel:
+    """The few fields of a HuggingFace listing entry the finder reads."""
+    id: str
+    downloads: int
+    tags: tuple
+    pipeline_tag: str
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_model_id(model_id):
+    """Return the frozenset of lowercase identifier variations for a model id.
+
+    Variants are interned so identical identifiers across models share one
+    string object, and the separator swaps are skipped entirely for names
+    without '-' or '_' (where all three variants would be equal anyway).
+    A frozenset keeps the result safely shareable from the cache and its
+    hash computes once.
+    """
+    variations = set()
+    for part in (model_id, model_id.split('/')[-1]):
+        lowered = sys.intern(part.lower())
+        variations.add(lowered)
+        if '-' in lowered or '_' in lowered:
+            underscored = sys.intern(lowered.replace('-', '_'))
+            variations.add(underscored)
+            variations.add(sys.intern(underscored.replace('_', '-')))
+    return frozenset(variations)
+
+
+def _extract_record(stem, data):
+    release = data.get('release') or {}
+    name = release.get('name') or stem
+    origin = release.get('origin') or ''
+    huggingface = release.get('huggingface') or ''
+    identifiers = set()
+    for value in (stem, name, origin):
+        if value:
+            identifiers |= _normalize_model_id(str(value))
+    if huggingface:
+        hf_id = huggingface.rstrip('/').split('huggingface.co/')[-1]
+        identifiers |= _normalize_model_id(hf_id)
+    return {
+        'name': name,
+        'origin': origin,
+        'huggingface': huggingface,
+        'identifiers': identifiers,
+        'file': f'{stem}.yml',
+    }
+
+
+def _parse_one_yaml(path):
+    """Process-pool worker: parse one model YAML into (stem, record)."""
+    path = Path(path)
+    try:
+        with open(path, 'rb') as f:
+            data = yaml.load(f.read(), Loader=SafeLoader)
+    except yaml.YAMLError as e:
+        print(f"Warning: failed to parse {path.name}: {e}", file=sys.stderr)
+        return None
+    if not data:
+        return None
+    return path.stem, _extract_record(path.stem, data)
+
+
+class MissingModelsFinder:
+
+    HF_API_URL = 'https://huggingface.co/api/models'
+    INDEX_FILE = '.mot_index.json.zst'
+    TYPE_SET = frozenset({
+        'text-generation',
+        'text2text-generation',
+        'image-classification',
+        'object-detection',
+        'automatic-speech-recognition',
+        'text-to-image',
+        'image-to-text',
+        'translation',
+    })
+
+    def __init__(self, models_dir='models'):
+        self.models_dir = Path(models_dir)
+        self.mot_models = {}
+        self._identifier_index = {}
+
+    @staticmethod
+    def normalize_model_id(model_id):
+        """Return the frozenset of identifier variations for a model id."""
+        return _normalize_model_id(model_id)
+
+    def _load_cached_records(self):
+        """Load the sidecar JSON index; staleness is checked per record."""
+        index_path = self.models_dir / self.INDEX_FILE
+        try:
+            with open(index_path, 'rb') as f:
+                cached = orjson.loads(zstd.ZstdDecompressor().decompress(f.read()))
+        except (OSError, ValueError, zstd.ZstdError):
+            return {}
+        records = cached.get('models', {})
+        for record in records.values():
+            record['identifiers'] = set(record['identifiers'])
+        return records
+
+    def _save_cached_records(self, mot_models):
+        index = {
+            'models': {
+                stem: dict(record, identifiers=sorted(record['identifiers']))
+                for stem, record in mot_models.items()
+            },
+        }
+        index_path = self.models_dir / self.INDEX_FILE
+        try:
+            with open(index_path, 'wb') as f:
+                f.write(zstd.ZstdCompressor(level=3).compress(orjson.dumps(index)))
+        except OSError as e:
+            print(f"Warning: could not write {index_path}: {e}", file=sys.stderr)
+
+    def get_mot_models(self):
+        """Load the model catalog, parsing only YAMLs that changed.
+
+        Directory listing uses os.scandir so each entry's stat is read
+        once; records whose cached mtime_ns still matches are reused
+        without touching the YAML at all.
+        """
+        with os.scandir(self.models_dir) as it:
+            entries = [e for e in it if e.name.endswith('.yml') and e.is_file()]
+        cached = self._load_cached_records()
+        mot_models = {}
+        to_parse = []
+        mtimes = {}
+        for entry in entries:
+            stem = entry.name[:-4]
+            mtime_ns = entry.stat().st_mtime_ns
+            record = cached.get(stem)
+            if record is not None and record.get('mtime_ns') == mtime_ns:
+                mot_models[stem] = record
+            else:
+                to_parse.append(entry.path)
+                mtimes[stem] = mtime_ns
+        if to_parse:
+            with ProcessPoolExecutor() as executor:
+                for parsed in executor.map(_parse_one_yaml, to_parse,
+                                           chunksize=32):
+                    if parsed:
+                        stem, record = parsed
+                        record['mtime_ns'] = mtimes[stem]
+                        mot_models[stem] = record
+        if to_parse or len(mot_models) != len(cached):
+            self._save_cached_records(mot_models)
+        self.mot_models = mot_models
+        self._build_identifier_index(mot_models)
+        return mot_models
+
+    def _build_identifier_index(self, mot_models):
+        """Map every identifier variation to its MOT file for O(1) lookups."""
+        index = {}
+        for record in mot_models.values():
+            for identifier in record['identifiers']:
+                index[identifier] = record['file']
+        self._identifier_index = index
+
+    async def _fetch_pages_async(self, n_pages, min_downloads):
+        """Fetch listing pages in waves, stopping at the download cutoff.
+
+        The query is sorted by downloads descending, so the first page
+        that ends below min_downloads makes every later page irrelevant;
+        pages go out in waves of 4 and the cutoff is checked per wave.
+        """
+        wave_size = 4
+        batches = []
+        semaphore = asyncio.Semaphore(5)
+        async with httpx.AsyncClient(
+                http2=True,
+                headers={'User-Agent': 'model-openness-tool'},
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32,
+                                    max_keepalive_connections=16),
+                transport=httpx.AsyncHTTPTransport(retries=3)) as client:
+            # Preconnect so the page coroutines multiplex onto one
+            # established connection instead of racing to open it.
+            try:
+                await client.head(self.HF_API_URL, timeout=5)
+            except httpx.HTTPError:
+                pass
+
+            async def fetch_page(page):
+                params = {
+                    'sort': 'downloads',
+                    'direction': -1,
+                    'limit': 100,
+                    'skip': page * 100,
+                }
+                async with semaphore:
+                    response = await client.get(self.HF_API_URL, params=params)
+                    response.raise_for_status()
+                    return orjson.loads(response.content)
+
+            for start in range(0, n_pages, wave_size):
+                stop = min(start + wave_size, n_pages)
+                wave = await asyncio.gather(
+                    *[fetch_page(i) for i in range(start, stop)])
+                batches.extend(wave)
+                if any(not batch for batch in wave):
+                    break
+                tail = wave[-1][-1]
+                if tail.get('downloads', 0) < min_downloads:
+                    break
+        return batches
+
+    def get_huggingface_models(self, limit=1000, min_downloads=10000):
+        """Fetch the most downloaded models from the HuggingFace API."""
+        n_pages = math.ceil(limit / 100)
+        batches = asyncio.run(self._fetch_pages_async(n_pages, min_downloads))
+        models = []
+        for batch in batches:
+            if not batch:
+                break
+            for model in batch:
+                downloads = model.get('downloads', 0)
+                if downloads < min_downloads:
+                    # Sorted by downloads, so nothing after this qualifies.
+                    return models[:limit]
+                models.append(HFModel(id=model.get('id', 'unknown'),
+                                      downloads=downloads,
+                                      tags=tuple(model.get('tags') or ()),
+                                      pipeline_tag=model.get('pipeline_tag') or ''))
+        return models[:limit]
+
+    def is_model_in_mot(self, model_id):
+        """Check whether a HuggingFace model id matches any MOT entry."""
+        variations = self.normalize_model_id(model_id)
+        if self._identifier_index:
+            for variation in variations:
+                hit = self._identifier_index.get(variation)
+                if hit:
+                    return True, hit
+            return False, None
+        for mot_data in self.mot_models.values():
+            if not variations.isdisjoint(mot_data['identifiers']):
+                return True, mot_data['file']
+        return False, None
+
+    def find_missing_models(self, limit=1000, min_downloads=10000):
+        self.get_mot_models()
+        hf_models = self.get_huggingface_models(limit=limit, min_downloads=min_downloads)
+        missing = []
+        for model in hf_models:
+            found, _ = self.is_model_in_mot(model.id)
+            if not found:
+                missing.append(model)
+        return missing
+
+    def categorize_missing_models(self, missing_models):
+        """Group missing models by download priority and by model type."""
+        sorted_models = sorted(missing_models, key=_dl_key, reverse=True)
+        # Negated downloads form an ascending array, so the two priority
+        # thresholds become bisect splits instead of per-model branches.
+        neg_downloads = [-m.downloads for m in sorted_models]
+        split_high = bisect.bisect_right(neg_downloads, -100000)
+        split_medium = bisect.bisect_right(neg_downloads, -10000)
+        categories = {
+            'high_priority': sorted_models[:split_high],
+            'medium_priority': sorted_models[split_high:split_medium],
+            'low_priority': sorted_models[split_medium:],
+            'by_type': defaultdict(list),
+        }
+        type_set = self.TYPE_SET
+        for model in sorted_models:
+            pipeline_tag = model.pipeline_tag
+            model_type = pipeline_tag if pipeline_tag in type_set else 'other'
+            categories['by_type'][model_type].append(model)
+        return categories
+
+    def generate_report(self, categories, output_file=None):
+        """Build a plain-text report of the missing models."""
+        buf = io.StringIO()
+        w = buf.write
+        w(_EQ80)
+        w('MISSING MODELS REPORT\n')
+        w(_EQ80)
+        w('\n')
+        total = sum(len(categories[k]) for k in
+                    ('high_priority', 'medium_priority', 'low_priority'))
+        w(f'Total missing models: {total}\n')
+        w(f"  High priority (>=100k downloads):   {len(categories['high_priority'])}\n")
+        w(f"  Medium priority (>=10k downloads):  {len(categories['medium_priority'])}\n")
+        w(f"  Low priority (<10k downloads):      {len(categories['low_priority'])}\n")
+        w('\n')
+        w(_DASH80)
+        w('BY MODEL TYPE\n')
+        w(_DASH80)
+        for model_type in sorted(categories['by_type']):
+            w(f"  {model_type}: {len(categories['by_type'][model_type])}\n")
+        w('\n')
+        w(_DASH80)
+        w('TOP MISSING MODELS (high priority)\n')
+        w(_DASH80)
+        # high_priority comes out of categorize_missing_models already
+        # sorted by downloads descending, so the top N is a plain slice.
+        row = '  {:<60} {:>12,}\n'.format
+        for model in categories['high_priority'][:50]:
+            w(row(model.id, model.downloads))
+        w(_EQ80)
+        report = buf.getvalue()
+        if output_file:
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(report)
+            print(f"Report written to {output_file}")
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Report popular HuggingFace models missing from the MOT catalog.')
+    parser.add_argument('--models-dir', default='models',
+                        help='Directory containing the MOT model YAML files.')
+    parser.add_argument('--limit', type=int, default=1000,
+                        help='Maximum number of HuggingFace models to check.')
+    parser.add_argument('--min-downloads', type=int, default=10000,
+                        help='Ignore HuggingFace models below this download count.')
+    parser.add_argument('--output', default=None,
+                        help='Optional file to write the report to.')
+    args = parser.parse_args()
+
+    finder = MissingModelsFinder(models_dir=args.models_dir)
+    missing = finder.find_missing_models(limit=args.limit,
+                                         min_downloads=args.min_downloads)
+    categories = finder.categorize_missing_models(missing)
+    print(finder.generate_report(categories, output_file=args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""Draft a MOT-style model YAML from a HuggingFace model page.
+
+Scrapes the HuggingFace API, model card and file listing for a model id,
+detects the MOF components and licenses it can, and writes a YAML draft
+in the same shape as the files under models/. The output is a starting
+point for a catalog entry, not a finished one.
+
+Usage: python scripts/model_scraper.py <org/model> [-o output.yml]
+"""
+
+import functools
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+_SESSION = None
+
+
+def _get_session():
+    """Build the shared HTTP session on first use.
+
+    One pooled session for the whole module: every scrape hits the same
+    two hosts (huggingface.co and github.com), so keep-alive connections
+    are reused across the API call, the card download and the repo
+    probes. With requests-cache installed the session also persists
+    responses to ~/.cache/mof_scraper.sqlite for a day, so re-running the
+    scraper for the same model (common while hand-editing the YAML draft)
+    skips the network entirely; 404s are cached too so repeated GitHub
+    probes stay free.
+
+    Constructed lazily so invocations that never reach the network
+    (--help, bad arguments) do not pay for importing the HTTP stack.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+        try:
+            from requests_cache import CachedSession
+            session = CachedSession(
+                cache_name=os.path.expanduser('~/.cache/mof_scraper'),
+                backend='sqlite',
+                expire_after=86400,
+                allowable_methods=('GET', 'HEAD'),
+                allowable_codes=(200, 404))
+        except ImportError:
+            session = requests.Session()
+        session.headers.update({'User-Agent': 'model-openness-tool'})
+        if os.environ.get('HF_TOKEN'):
+            session.headers['Authorization'] = f"Bearer {os.environ['HF_TOKEN']}"
+        session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2,
+                              backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504],
+                              allowed_methods=['HEAD', 'GET'])))
+        _SESSION = session
+    return _SESSION
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_repo_exists(url):
+    """HEAD-probe a repository URL; identical probes are answered from cache."""
+    import requests
+    try:
+        response = _get_session().head(url, timeout=5, allow_redirects=True)
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
+
+
+_GITHUB_RE = re.compile(r'https://github\.com/[^/\s"<>)]+/[^/\s"<>)]+')
+_VERSION_RE = re.compile(r'(\d+\.?\d*[BMK]?)')
+
+# Model-card keyword -> component category. All keywords are matched in a
+# single scan of the card via one compiled alternation instead of one full
+# substring pass per keyword.
+_CARD_KEYWORDS = {
+    'training code': 'training_code',
+    'training script': 'training_code',
+    'train.py': 'training_code',
+    'pretraining code': 'training_code',
+    'training data': 'datasets',
+    'dataset': 'datasets',
+    'corpus': 'datasets',
+    'pretraining data': 'datasets',
+    'evaluation': 'evaluation_results',
+    'benchmark': 'evaluation_results',
+    'leaderboard': 'evaluation_results',
+    'arxiv': 'research_paper',
+    'research paper': 'research_paper',
+    'publication': 'research_paper',
+    'paper:': 'research_paper',
+    'technical report': 'technical_report',
+    'tech report': 'technical_report',
+}
+_CARD_KEYWORDS_RE = re.compile('|'.join(
+    re.escape(keyword)
+    for keyword in sorted(_CARD_KEYWORDS, key=len, reverse=True)))
+
+
+class ModelScraper:
+
+    OPEN_LICENSES = frozenset({
+        'apache-2.0',
+        'mit',
+        'bsd-2-clause',
+        'bsd-3-clause',
+        'cc0-1.0',
+        'cc-by-4.0',
+        'cc-by-sa-4.0',
+        'gpl-3.0',
+        'lgpl-3.0',
+        'mpl-2.0',
+    })
+
+    # Components detected from model card keywords: the category produced
+    # by the _CARD_KEYWORDS scan, the MOF component name and description,
+    # and whether the component carries the detected license. Extending
+    # coverage means adding a row here (and keywords to _CARD_KEYWORDS),
+    # not another branch in detect_components.
+    COMPONENT_RULES = (
+        ('training_code', 'Training code',
+         'Code used for training the model', True),
+        ('datasets', 'Datasets',
+         'Training, validation and testing datasets used for the model', False),
+        ('evaluation_results', 'Evaluation results',
+         'The results from evaluating the model', False),
+        ('research_paper', 'Research paper',
+         'Research paper detailing the development and capabilities of the model', False),
+        ('technical_report', 'Technical report',
+         'Technical report detailing capabilities and usage instructions for the model', False),
+    )
+
+    # Compared against the lowercased file listing, so any casing of
+    # LICENSE/License/license matches with one set membership per file.
+    LICENSE_FILES = frozenset({'license', 'license.md', 'license.txt'})
+
+    # Model cards can run to multiple MB; only short keyword checks are
+    # made against them, so cap how much is downloaded and scanned.
+    CARD_MAX_BYTES = 256 * 1024
+
+    def __init__(self):
+        self.session = _get_session()
+
+    def scrape_huggingface_model(self, model_id):
+        """Fetch API metadata, model card and file listing for a model."""
+        import requests
+        api_url = f'https://huggingface.co/api/models/{model_id}'
+        card_url = f'https://huggingface.co/{model_id}/raw/main/README.md'
+        files_url = (f'https://huggingface.co/api/models/{model_id}'
+                     '/tree/main?recursive=true')
+
+        # The three GETs are independent, so issue them together over the
+        # pooled session and the scrape costs ~one round-trip, not three.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            api_future = executor.submit(self.session.get, api_url, timeout=30)
+            card_future = executor.submit(self.session.get, card_url,
+                                          timeout=30, stream=True)
+            files_future = executor.submit(self.session.get, files_url, timeout=30)
+
+            response = api_future.result()
+            response.raise_for_status()
+            api_data = response.json()
+
+            model_card_content = ''
+            try:
+                card_response = card_future.result()
+                if card_response.status_code == 200:
+                    raw = card_response.raw.read(self.CARD_MAX_BYTES,
+                                                 decode_content=True)
+                    model_card_content = raw.decode('utf-8', 'ignore')
+                card_response.close()
+            except requests.RequestException:
+                pass
+
+            repo_files = []
+            try:
+                # The tree endpoint caps entries per response and points at
+                # the next batch via a Link header; follow the cursor so
+                # large repos do not get a truncated file listing.
+                files_response = files_future.result()
+                while files_response.status_code == 200:
+                    repo_files.extend(
+                        f.get('path', '') for f in files_response.json())
+                    next_url = files_response.links.get('next', {}).get('url')
+                    if not next_url:
+                        break
+                    files_response = self.session.get(next_url, timeout=30)
+            except requests.RequestException:
+                pass
+
+        card_data = api_data.get('cardData') or {}
+        return {
+            'model_id': model_id,
+            'api_data': api_data,
+            'model_card': model_card_content,
+            'model_card_lower': model_card_content.lower(),
+            'repo_files': repo_files,
+            'repo_files_lower': [f.lower() for f in repo_files],
+            'tags': api_data.get('tags', []),
+            'license': card_data.get('license') or '',
+            'last_modified': api_data.get('lastModified', ''),
+        }
+
+    def detect_components(self, scraped_data):
+        """Detect which MOF components the HuggingFace repo appears to ship."""
+        components = []
+        model_card = scraped_data.get('model_card_lower', '')
+        repo_files = scraped_data.get('repo_files', [])
+        repo_files_lower = scraped_data.get('repo_files_lower', [])
+        model_id = scraped_data['model_id']
+        tree_url = f'https://huggingface.co/{model_id}/tree/main'
+        hits = {_CARD_KEYWORDS[match]
+                for match in _CARD_KEYWORDS_RE.findall(model_card)}
+        # The license is the same for every component; detect it once.
+        detected_license = self._detect_license(scraped_data)
+
+        # Classify the file listing in one pass instead of re-scanning it
+        # per component.
+        has_weights = has_architecture = has_inference = has_readme = False
+        weight_exts = ('.bin', '.safetensors', '.pt', '.pth', '.ckpt')
+        for f, fl in zip(repo_files, repo_files_lower):
+            if fl.endswith(weight_exts):
+                has_weights = True
+            if 'modeling' in fl or fl.endswith('.py'):
+                has_architecture = True
+            if 'inference' in fl or 'generate' in fl:
+                has_inference = True
+            if f == 'README.md':
+                has_readme = True
+
+        if has_weights:
+            components.append({
+                'name': 'Model parameters (Final)',
+                'description': 'Trained model parameters, weights and biases',
+                'license': detected_license,
+                'location': tree_url,
+            })
+
+        if has_architecture:
+            components.append({
+                'name': 'Model architecture',
+                'description': "Well commented code for the model's architecture",
+                'license': detected_license,
+                'location': tree_url,
+            })
+
+        if has_inference:
+            components.append({
+                'name': 'Inference code',
+                'description': 'Code used for running the model to make predictions',
+                'license': detected_license,
+                'location': tree_url,
+            })
+
+        for category, name, description, licensed in self.COMPONENT_RULES:
+            if category in hits:
+                components.append({
+                    'name': name,
+                    'description': description,
+                    'license': detected_license if licensed else '',
+                    'location': '',
+                })
+
+        if has_readme:
+            components.append({
+                'name': 'Model card',
+                'description': 'Model details including performance metrics, intended use, and limitations',
+                'license': detected_license,
+                'location': f'https://huggingface.co/{model_id}/blob/main/README.md',
+            })
+
+        return components
+
+    def _detect_license(self, scraped_data):
+        """Best-effort license id from API metadata, tags or repo files."""
+        license_id = scraped_data.get('license', '')
+        if not license_id:
+            for tag in scraped_data.get('tags', []):
+                if tag.startswith('license:'):
+                    license_id = tag.split(':', 1)[1]
+                    break
+        if not license_id:
+            repo_files_lower = scraped_data.get('repo_files_lower', [])
+            if any(f in self.LICENSE_FILES for f in repo_files_lower):
+                license_id = 'unknown'
+        return license_id
+
+    def _detect_repository(self, model_id, model_card):
+        """Find the source repository: card links first, then GitHub probes."""
+        model_name = model_id.split('/')[-1].lower()
+        first_url = None
+        for match in _GITHUB_RE.finditer(model_card):
+            url = match.group(0)
+            if model_name in url.lower():
+                return url, 0.9
+            if first_url is None:
+                first_url = url
+        if first_url:
+            return first_url, 0.7
+
+        org, _, name = model_id.partition('/')
+        if org and name:
+            candidates = [
+                f'https://github.com/{org}/{name}',
+                f'https://github.com/{org}/{name.split("-")[0]}',
+                f'https://github.com/{org}/{name.lower()}',
+                f'https://github.com/{org}/{org}',
+            ]
+            # Probe the deduplicated candidates in parallel, then pick the
+            # first hit in preference order: one HEAD round-trip, not four.
+            unique = list(dict.fromkeys(candidates))
+            with ThreadPoolExecutor(max_workers=len(unique)) as executor:
+                exists = dict(zip(unique,
+                                  executor.map(self._check_repo_exists, unique)))
+            for url in candidates:
+                if exists.get(url):
+                    return url, 0.8
+        return '', 0.0
+
+    def _check_repo_exists(self, url):
+        return _check_repo_exists(url)
+
+    def _extract_model_metadata(self, scraped_data):
+        """Map the scraped data onto the release fields of a MOT YAML."""
+        model_id = scraped_data['model_id']
+        model_name = model_id.split('/')[-1]
+        org = model_id.split('/')[0] if '/' in model_id else ''
+        api_data = scraped_data.get('api_data', {})
+        tags = scraped_data.get('tags', [])
+        model_card = scraped_data.get('model_card_lower', '')
+
+        version_match = _VERSION_RE.search(model_name)
+        version = version_match.group(1) if version_match else '1.0'
+
+        architecture = ''
+        # HuggingFace tags are lowercase by convention; compare directly.
+        if 'transformer' in model_card or any('transformer' in t for t in tags):
+            architecture = 'transformer'
+
+        pipeline_tag = api_data.get('pipeline_tag', '')
+        if pipeline_tag.startswith('text-') or 'translation' in pipeline_tag:
+            model_type = 'language'
+        elif pipeline_tag.startswith('image-') or pipeline_tag.startswith('object-'):
+            model_type = 'vision'
+        elif 'speech' in pipeline_tag or 'audio' in pipeline_tag:
+            model_type = 'audio'
+        else:
+            model_type = 'multimodal'
+
+        last_modified = scraped_data.get('last_modified', '')
+        release_date = last_modified.split('T', 1)[0] if last_modified \
+            else date.today().isoformat()
+
+        repository, _ = self._detect_repository(
+            model_id, scraped_data.get('model_card', ''))
+
+        return {
+            'name': model_name,
+            'version': version,
+            'date': release_date,
+            'type': model_type,
+            'architecture': architecture,
+            'producer': org,
+            'repository': repository,
+            'huggingface': f'https://huggingface.co/{model_id}',
+            'license': self._detect_license(scraped_data),
+        }
+
+    def _format_yaml_mot_style(self, metadata, components):
+        """Render the YAML by hand so it matches the models/ file layout."""
+        lines = []
+        lines.append('framework:')
+        lines.append("  name: 'Model Openness Framework'")
+        lines.append("  version: '1.0'")
+        lines.append("  date: '2024-12-15'")
+        lines.append('release:')
+        lines.append(f"  name: {metadata['name']}")
+        lines.append(f"  version: {metadata['version']}")
+        lines.append(f"  date: '{metadata['date']}'")
+        lines.append(f"  type: {metadata['type']}")
+        lines.append(f"  architecture: '{metadata['architecture']}'")
+        lines.append("  origin: ''")
+        lines.append(f"  producer: {metadata['producer']}")
+        lines.append("  contact: ''")
+        lines.append(f"  repository: '{metadata['repository']}'")
+        lines.append(f"  huggingface: '{metadata['huggingface']}'")
+        if metadata['license']:
+            lines.append('  license:')
+            lines.append('    distribution:')
+            lines.append(f"      name: {metadata['license']}")
+            lines.append("      path: ''")
+        lines.append('  components:')
+        for component in components:
+            lines.append('    -')
+            lines.append(f"      name: '{component['name']}'")
+            lines.append(f"      description: \"{component['description']}\"")
+            if component.get('location'):
+                lines.append(f"      component_path: '{component['location']}'")
+            if component.get('license'):
+                lines.append(f"      license: {component['license']}")
+        return '\n'.join(lines) + '\n'
+
+    def generate_yaml(self, model_id, output_file=None):
+        """Scrape a model and return (or write) its MOT YAML draft."""
+        scraped_data = self.scrape_huggingface_model(model_id)
+        metadata = self._extract_model_metadata(scraped_data)
+        components = self.detect_components(scraped_data)
+        yaml_text = self._format_yaml_mot_style(metadata, components)
+        if output_file:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(yaml_text)
+            print(f"YAML draft written to {output_file}")
+        if metadata['license'] and metadata['license'] not in self.OPEN_LICENSES:
+            print(f"Note: license '{metadata['license']}' is not a known open license",
+                  file=sys.stderr)
+        return yaml_text
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(
+        description='Draft a MOT model YAML from a HuggingFace model page.')
+    parser.add_argument('model_id', help='HuggingFace model id, e.g. org/model')
+    parser.add_argument('-o', '--output', default=None,
+                        help='File to write the YAML draft to (default: stdout).')
+    args = parser.parse_args()
+
+    import requests
+    scraper = ModelScraper()
+    try:
+        yaml_text = scraper.generate_yaml(args.model_id, output_file=args.output)
+    except requests.RequestException as e:
+        print(f"Error: could not scrape {args.model_id}: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not args.output:
+        print(yaml_text)
+
+
+if __name__ == '__main__':
+    main()